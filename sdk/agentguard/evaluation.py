@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 
 @dataclass
@@ -391,15 +391,18 @@ def summarize_trace(
         print(f"Duration: {summary['duration_ms']:.1f}ms")
     """
     if isinstance(path_or_events, str):
-        events = _load_events(path_or_events)
-    elif isinstance(path_or_events, list):
-        events = path_or_events
-    else:
-        raise TypeError(
-            f"Expected str (file path) or list of events, got {type(path_or_events).__name__}"
-        )
+        # Stream the file: one pass, no intermediate list of events
+        with open(path_or_events, encoding="utf-8") as f:
+            return _summarize_events(_iter_events(f))
+    if isinstance(path_or_events, list):
+        return _summarize_events(path_or_events)
+    raise TypeError(
+        f"Expected str (file path) or list of events, got {type(path_or_events).__name__}"
+    )
 
-    total = len(events)
+
+def _summarize_events(events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    total = 0
     spans = 0
     event_count = 0
     total_cost = 0.0
@@ -410,15 +413,20 @@ def summarize_trace(
     loop_detections = 0
 
     for e in events:
-        kind = e.get("kind", "")
-        name = e.get("name", "")
+        total += 1
+        get = e.get
+        kind = get("kind", "")
+        name = get("name", "")
+        phase = get("phase")
 
         if kind == "span":
             spans += 1
-            if e.get("phase") == "end":
-                dur = e.get("duration_ms")
+            if phase == "end":
+                dur = get("duration_ms")
                 if isinstance(dur, (int, float)) and dur > max_duration_ms:
                     max_duration_ms = float(dur)
+            elif phase == "start" and name.startswith("tool."):
+                tool_calls += 1
         elif kind == "event":
             event_count += 1
 
@@ -427,16 +435,12 @@ def summarize_trace(
         if cost is not None:
             total_cost += cost
 
-        # Tool calls
-        if name.startswith("tool.") and kind == "span" and e.get("phase") == "start":
-            tool_calls += 1
-
         # LLM calls
-        if name in ("llm.call", "llm.result") and e.get("phase") == "start":
+        if phase == "start" and name in ("llm.call", "llm.result"):
             llm_calls += 1
 
         # Errors
-        if e.get("error") is not None:
+        if get("error") is not None:
             error_count += 1
 
         # Loop detections
@@ -494,15 +498,18 @@ def _count_tool_calls(events: List[Dict[str, Any]], tool_name: str) -> int:
 # --- loader ---
 
 
+def _iter_events(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Yield parsed events from JSONL lines, skipping blank and malformed ones."""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            continue
+
+
 def _load_events(path: str) -> List[Dict[str, Any]]:
-    events: List[Dict[str, Any]] = []
     with open(path, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                events.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return events
+        return list(_iter_events(f))
@@ -11,9 +11,16 @@ from __future__ import annotations
 
 import csv
 import json
-from typing import List, Optional
+import os
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
-from agentguard.evaluation import _load_events
+from agentguard.evaluation import _iter_events
+
+
+def _same_file(input_path: str, output_path: str) -> bool:
+    """Return True if *output_path* already exists and is *input_path*."""
+    return os.path.exists(output_path) and os.path.samefile(input_path, output_path)
 
 
 def export_json(input_path: str, output_path: str) -> int:
@@ -26,10 +33,21 @@ def export_json(input_path: str, output_path: str) -> int:
     Returns:
         Number of events exported.
     """
-    events = _load_events(input_path)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(events, f, indent=2, sort_keys=True)
-    return len(events)
+    count = 0
+    with open(input_path, encoding="utf-8") as src:
+        events: Iterable[Dict[str, Any]] = _iter_events(src)
+        if _same_file(input_path, output_path):
+            # Opening the output truncates the input, so read it all first
+            events = list(events)
+        with open(output_path, "w", encoding="utf-8") as dst:
+            # Stream one event at a time, matching json.dump(events, indent=2)
+            # output without holding the whole trace in memory.
+            for event in events:
+                body = json.dumps(event, indent=2, sort_keys=True).replace("\n", "\n  ")
+                dst.write(("[\n  " if count == 0 else ",\n  ") + body)
+                count += 1
+            dst.write("\n]" if count else "[]")
+    return count
 
 
 def export_csv(input_path: str, output_path: str, columns: Optional[List[str]] = None) -> int:
@@ -43,27 +61,44 @@ def export_csv(input_path: str, output_path: str, columns: Optional[List[str]] =
     Returns:
         Number of rows exported.
     """
-    events = _load_events(input_path)
-    if not events:
-        return 0
-
     if columns is None:
         columns = [
             "service", "kind", "phase", "name", "trace_id", "span_id",
             "parent_id", "ts", "duration_ms", "error",
         ]
 
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
-        writer.writeheader()
-        for event in events:
-            # Flatten error to string
-            row = dict(event)
-            if "error" in row and isinstance(row["error"], dict):
-                row["error"] = json.dumps(row["error"])
-            writer.writerow(row)
+    count = 0
+    with open(input_path, encoding="utf-8") as src:
+        events: Iterator[Dict[str, Any]] = _iter_events(src)
+        if _same_file(input_path, output_path):
+            # Opening the output truncates the input, so read it all first
+            events = iter(list(events))
+        first = next(events, None)
+        if first is None:
+            return 0
+
+        def _rows() -> Iterator[Dict[str, Any]]:
+            nonlocal count
+            for event in chain((first,), events):
+                count += 1
+                yield _flatten_csv_row(event)
+
+        with open(output_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(_rows())
+
+    return count
+
 
-    return len(events)
+def _flatten_csv_row(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a dict-valued ``error`` field to a JSON string for CSV output."""
+    error = event.get("error")
+    if isinstance(error, dict):
+        row = dict(event)
+        row["error"] = json.dumps(error)
+        return row
+    return event
 
 
 def export_jsonl(input_path: str, output_path: str) -> int:
@@ -76,8 +111,14 @@ def export_jsonl(input_path: str, output_path: str) -> int:
     Returns:
         Number of events exported.
     """
-    events = _load_events(input_path)
-    with open(output_path, "w", encoding="utf-8") as f:
-        for event in events:
-            f.write(json.dumps(event, sort_keys=True) + "\n")
-    return len(events)
+    count = 0
+    with open(input_path, encoding="utf-8") as src:
+        events: Iterable[Dict[str, Any]] = _iter_events(src)
+        if _same_file(input_path, output_path):
+            # Opening the output truncates the input, so read it all first
+            events = list(events)
+        with open(output_path, "w", encoding="utf-8") as dst:
+            for event in events:
+                dst.write(json.dumps(event, sort_keys=True) + "\n")
+                count += 1
+    return count
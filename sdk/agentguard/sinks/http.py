@@ -10,16 +10,20 @@ Usage::
 from __future__ import annotations
 
 import atexit
-import gzip
+import base64
+import http.client
+import io
 import ipaddress
 import json
 import logging
+import os
 import socket
 import threading
 import time
 import urllib.request
-import uuid
-from typing import Any, Dict, List, Optional
+import zlib
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 from urllib.error import HTTPError
 from urllib.parse import urlparse
 
@@ -28,6 +32,14 @@ from agentguard.tracing import TraceSink
 logger = logging.getLogger("agentguard.sinks.http")
 _INGEST_EVENT_KINDS = frozenset({"span", "event"})
 
+# zlib wbits value that emits a gzip header and trailer (16 + MAX_WBITS)
+_GZIP_WBITS = 31
+# Shared compact encoder: json.dumps() with non-default kwargs builds a new
+# JSONEncoder per call, and compact separators shrink the NDJSON batch body.
+_BATCH_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+# Bodies below this size compress nearly as well at level 1 as at level 6
+_SMALL_BODY_BYTES = 4096
+
 
 # Private/reserved IP ranges that should never be used as sink endpoints
 # Includes 169.254.169.254 (AWS/GCP/Azure metadata endpoint) via 169.254.0.0/16
@@ -148,7 +160,8 @@ class _SsrfSafeRedirectHandler(urllib.request.HTTPRedirectHandler):
 
 
 # Build an opener that uses our SSRF-safe redirect handler
-_opener = urllib.request.build_opener(_SsrfSafeRedirectHandler)
+_REDIRECT_HANDLER = _SsrfSafeRedirectHandler()
+_opener = urllib.request.build_opener(_REDIRECT_HANDLER)
 
 
 def _normalize_event_for_ingest(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -175,18 +188,36 @@ def _normalize_event_for_ingest(event: Dict[str, Any]) -> Optional[Dict[str, Any
     return normalized
 
 
+def _new_idempotency_key() -> str:
+    """Return a random 128-bit idempotency key as 22 URL-safe base64 chars."""
+    return base64.urlsafe_b64encode(os.urandom(16))[:22].decode("ascii")
+
+
+def _gzip_body(body: bytes, level: int = 6) -> bytes:
+    """Gzip-compress a request body as a single self-contained gzip member.
+
+    Uses ``zlib.compressobj`` directly rather than ``gzip.compress`` to skip
+    the ``GzipFile``/``BytesIO`` wrapper on Python versions that still route
+    through it. Each batch gets a fresh compressor because every POST body
+    must be an independent gzip stream for the ingest endpoint.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+
 class HttpSink(TraceSink):
     """Batched HTTP sink that POSTs JSONL trace events to a remote endpoint.
 
-    Uses only stdlib (urllib.request). Events are buffered and flushed
-    periodically in a background thread. Network failures are logged
-    but never crash the calling agent.
+    Uses only stdlib (http.client, urllib.request). Events are buffered
+    and flushed periodically in a background thread. Network failures are
+    logged but never crash the calling agent.
 
     Features:
-    - Gzip compression (stdlib gzip)
+    - Gzip compression (stdlib zlib, gzip framing)
     - Retry with exponential backoff (3 attempts, 1s/2s/4s)
-    - UUID idempotency keys per batch
+    - Random 128-bit idempotency keys per batch
     - Respects 429 + Retry-After header
+    - Keep-alive connection reused across batches
     - SSRF protection on redirects
 
     Usage::
@@ -204,7 +235,14 @@ class HttpSink(TraceSink):
         api_key: Optional API key sent as Bearer token.
         batch_size: Flush when this many events are buffered.
         flush_interval: Flush every N seconds regardless of buffer size.
+        max_event_age: Optional cap in seconds on how long a buffered event
+            may wait before a partial batch is flushed. Default None keeps
+            the plain ``flush_interval`` schedule; set it below
+            ``flush_interval`` to cut tail latency for bursty agents at the
+            cost of more, smaller POSTs.
         compress: Enable gzip compression. Default True.
+        compress_level: Gzip level 0-9. Default None picks level 1 for
+            bodies under 4 KiB and level 6 for larger ones.
         max_retries: Maximum retry attempts on failure. Default 3.
         max_buffer_size: Maximum events to buffer before dropping oldest. Default 10000.
     """
@@ -215,7 +253,9 @@ class HttpSink(TraceSink):
         api_key: Optional[str] = None,
         batch_size: int = 10,
         flush_interval: float = 5.0,
+        max_event_age: Optional[float] = None,
         compress: bool = True,
+        compress_level: Optional[int] = None,
         max_retries: int = 3,
         max_buffer_size: int = 10_000,
         _allow_private: bool = False,
@@ -238,18 +278,53 @@ class HttpSink(TraceSink):
                         f"HttpSink: URL contains credentials in query string ({param}...). "
                         f"Use the api_key parameter instead."
                     )
+        if compress_level is not None and not 0 <= compress_level <= 9:
+            raise ValueError("compress_level must be between 0 and 9")
+        if max_event_age is not None and max_event_age <= 0:
+            raise ValueError("max_event_age must be > 0")
         self._url = url
+        parsed = urlparse(url)
+        self._conn_cls = (
+            http.client.HTTPSConnection if parsed.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._host = parsed.hostname
+        # Always pass an explicit port: http.client re-splits a bare host on
+        # its last ":", which mangles IPv6 literals like 2606:4700::1111.
+        self._port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        self._path = (parsed.path or "/") + (f"?{parsed.query}" if parsed.query else "")
+        # Proxied endpoints keep going through urllib, which honors proxy env vars
+        self._use_opener = bool(
+            urllib.request.getproxies().get(parsed.scheme)
+            and not urllib.request.proxy_bypass(parsed.hostname)
+        )
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._conn_lock = threading.Lock()
         self._api_key = api_key
         self._batch_size = batch_size
         self._flush_interval = flush_interval
+        self._max_event_age = max_event_age
         self._compress = compress
+        self._compress_level = compress_level
         self._max_retries = max_retries
         self._max_buffer_size = max_buffer_size
         self._dropped_count = 0
 
-        self._buffer: List[Dict[str, Any]] = []
+        # Bounded ring buffer: appending at capacity evicts the oldest event
+        # in O(1) instead of re-slicing the list.
+        self._buffer: Deque[Dict[str, Any]] = deque(maxlen=max_buffer_size)
         self._lock = threading.Lock()
+        # Batches taken off the buffer whose POST has not finished yet;
+        # flush() waits on _idle until this drops back to zero.
+        self._in_flight = 0
+        self._idle = threading.Condition(self._lock)
         self._stop = threading.Event()
+        # Wakes the flush thread early: with max_event_age set, when the buffer
+        # goes from empty to non-empty, and whenever flush() asks for a send
+        self._wake = threading.Event()
+        self._flush_requested = False
+        self._oldest_enqueue_ts: Optional[float] = None
+        self._last_flush_ts = time.monotonic()
 
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
@@ -259,33 +334,65 @@ class HttpSink(TraceSink):
         batch = None
         with self._lock:
             if len(self._buffer) >= self._max_buffer_size:
-                # Drop oldest events to prevent OOM
-                drop = len(self._buffer) - self._max_buffer_size + 1
-                self._buffer = self._buffer[drop:]
-                self._dropped_count += drop
+                # The deque evicts the oldest event on append to prevent OOM
+                self._dropped_count += 1
                 logger.warning(
-                    "HttpSink buffer full (%d max), dropped %d oldest event(s). "
+                    "HttpSink buffer full (%d max), dropped oldest event. "
                     "Total dropped: %d",
-                    self._max_buffer_size, drop, self._dropped_count,
+                    self._max_buffer_size, self._dropped_count,
                 )
             self._buffer.append(event)
             if len(self._buffer) >= self._batch_size:
-                batch = self._buffer[:]
+                batch = list(self._buffer)
                 self._buffer.clear()
+                self._oldest_enqueue_ts = None
+                self._in_flight += 1
+            elif self._max_event_age is not None and self._oldest_enqueue_ts is None:
+                # Only the age cap needs the flush thread to re-plan its sleep
+                self._oldest_enqueue_ts = time.monotonic()
+                self._wake.set()
         if batch:
-            self._send(batch)
+            self._send_tracked(batch)
 
     def _run(self) -> None:
-        while not self._stop.wait(self._flush_interval):
+        max_age = self._max_event_age
+        while not self._stop.is_set():
+            self._wake.clear()
+            with self._lock:
+                oldest = self._oldest_enqueue_ts
+                deadline = self._last_flush_ts + self._flush_interval
+                requested = self._flush_requested
+                self._flush_requested = False
+            if not requested:
+                if oldest is not None and max_age is not None:
+                    deadline = min(deadline, oldest + max_age)
+                timeout = deadline - time.monotonic()
+                if timeout > 0:
+                    # Re-evaluate early on a new batch or a flush() request
+                    self._wake.wait(timeout)
+                    continue
             self._flush()
 
     def _flush(self) -> None:
         with self._lock:
+            self._last_flush_ts = time.monotonic()
             if not self._buffer:
                 return
-            batch = self._buffer[:]
+            batch = list(self._buffer)
             self._buffer.clear()
-        self._send(batch)
+            self._oldest_enqueue_ts = None
+            self._in_flight += 1
+        self._send_tracked(batch)
+
+    def _send_tracked(self, batch: List[Dict[str, Any]]) -> None:
+        """Send a batch counted in ``_in_flight`` and signal when none remain."""
+        try:
+            self._send(batch)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                if not self._in_flight:
+                    self._idle.notify_all()
 
     def _send(self, batch: List[Dict[str, Any]]) -> None:
         if not batch:
@@ -298,30 +405,29 @@ class HttpSink(TraceSink):
         if not normalized_batch:
             return
 
-        body_str = "\n".join(json.dumps(e, sort_keys=True) for e in normalized_batch)
-        body = body_str.encode("utf-8")
+        encode = _BATCH_ENCODER.encode
+        body = "\n".join([encode(e) for e in normalized_batch]).encode("utf-8")
 
         headers: Dict[str, str] = {"Content-Type": "application/x-ndjson"}
         if self._api_key:
             headers["Authorization"] = f"Bearer {self._api_key}"
 
         # Idempotency key
-        idempotency_key = uuid.uuid4().hex
+        idempotency_key = _new_idempotency_key()
         headers["Idempotency-Key"] = idempotency_key
 
         # Gzip compression
         if self._compress:
-            body = gzip.compress(body)
+            level = self._compress_level
+            if level is None:
+                level = 1 if len(body) < _SMALL_BODY_BYTES else 6
+            body = _gzip_body(body, level)
             headers["Content-Encoding"] = "gzip"
 
         # Retry with exponential backoff
         for attempt in range(self._max_retries):
             try:
-                req = urllib.request.Request(
-                    self._url, data=body, headers=headers, method="POST"
-                )
-                with _opener.open(req, timeout=10) as resp:
-                    resp.read()
+                self._post(body, headers)
                 return  # success
             except HTTPError as e:
                 if e.code == 429:
@@ -371,11 +477,101 @@ class HttpSink(TraceSink):
                         exc_info=True,
                     )
 
+    def _post(self, body: bytes, headers: Dict[str, str]) -> None:
+        """POST one batch, raising ``HTTPError`` for non-2xx responses."""
+        if not self._use_opener:
+            with self._conn_lock:
+                status, reason, resp_headers = self._post_keepalive(body, headers)
+            if status < 300:
+                return
+            if status >= 400:
+                raise HTTPError(self._url, status, reason, resp_headers, None)
+            # 3xx: hand this response to the SSRF-safe redirect handler, as
+            # urllib would, instead of re-POSTing the batch to the origin.
+            req = urllib.request.Request(
+                self._url, data=body, headers=headers, method="POST"
+            )
+            req.timeout = 10
+            redirected = _REDIRECT_HANDLER.http_error_302(
+                req, io.BytesIO(), status, reason, resp_headers
+            )
+            if redirected is None:
+                raise HTTPError(self._url, status, reason, resp_headers, None)
+            with redirected as resp:
+                resp.read()
+            return
+        req = urllib.request.Request(
+            self._url, data=body, headers=headers, method="POST"
+        )
+        with _opener.open(req, timeout=10) as resp:
+            resp.read()
+
+    def _post_keepalive(self, body: bytes, headers: Dict[str, str]) -> Any:
+        """Send over the persistent connection, reconnecting once if it went stale.
+
+        Must be called with ``_conn_lock`` held. Returns
+        ``(status, reason, headers)``.
+        """
+        while True:
+            reused = self._conn is not None
+            if self._conn is None:
+                self._conn = self._conn_cls(self._host, self._port, timeout=10)
+            try:
+                self._conn.request("POST", self._path, body=body, headers=headers)
+                resp = self._conn.getresponse()
+                resp.read()
+                return resp.status, resp.reason, resp.headers
+            except (http.client.HTTPException, OSError):
+                self._conn.close()
+                self._conn = None
+                # A server may drop an idle keep-alive socket; retry once on a
+                # fresh connection. The idempotency key makes this safe.
+                if not reused:
+                    raise
+
+    def flush(self, timeout: Optional[float] = 2.0) -> bool:
+        """Send any buffered events now and wait for delivery.
+
+        Asks the background thread to send the buffer immediately, then waits
+        until the buffer is empty and every batch already handed off by
+        ``emit()`` or the background thread has been sent (or has exhausted
+        its retries).
+
+        Args:
+            timeout: Maximum seconds to wait. ``None`` waits without limit,
+                which can take minutes if the endpoint is slow or sends a
+                long ``Retry-After``.
+
+        Returns:
+            True if everything was delivered, False if the timeout expired
+            first. Undelivered batches keep sending in the background.
+        """
+        if not self._thread.is_alive():
+            # After shutdown() there is no flush thread to hand off to
+            self._flush()
+        with self._lock:
+            self._flush_requested = True
+            self._wake.set()
+            drained = self._idle.wait_for(
+                lambda: not self._buffer and not self._in_flight, timeout
+            )
+        if not drained:
+            logger.warning(
+                "HttpSink.flush() timed out after %.1fs with events still pending",
+                timeout,
+            )
+        return drained
+
     def shutdown(self) -> None:
         """Flush remaining events and stop the background thread."""
         self._stop.set()
+        self._wake.set()
         self._flush()
         self._thread.join(timeout=5)
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def __repr__(self) -> str:
         return f"HttpSink(url={self._url!r})"
@@ -24,7 +24,7 @@ import time
 import uuid
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from agentguard.cost import CostTracker
@@ -38,6 +38,10 @@ _MAX_EVENT_DATA_BYTES = 65_536  # 64 KB
 _TEXT_TRUNCATION_SUFFIX = "...[truncated]"
 _MIN_FIELD_BUDGET = 128
 _truncate_name = truncate_name
+# O_BINARY keeps Windows from translating "\n" in raw fd writes
+_JSONL_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+# Shared encoder: json.dumps(sort_keys=True) builds a new JSONEncoder per call
+_JSONL_ENCODER = json.JSONEncoder(sort_keys=True)
 
 
 class TraceSink:
@@ -88,9 +92,17 @@ class JsonlFileSink(TraceSink):
 
     def emit(self, event: Dict[str, Any]) -> None:
         """Append an event as a JSON line to the file."""
-        line = json.dumps(event, sort_keys=True)
-        with self._lock, open(self._path, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        data = (_JSONL_ENCODER.encode(event) + "\n").encode("utf-8")
+        with self._lock:
+            # Raw fd + one O_APPEND write per event: skips the text/buffered
+            # io layers while keeping every line visible to readers at once.
+            fd = os.open(self._path, _JSONL_OPEN_FLAGS, 0o666)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
 
     def __repr__(self) -> str:
         return f"JsonlFileSink({self._path!r})"
@@ -274,6 +286,31 @@ def _check_guard(guard: Any, name: str, data: Optional[Dict[str, Any]] = None) -
     )
 
 
+def _always_sample() -> bool:
+    return True
+
+
+def _never_sample() -> bool:
+    return False
+
+
+def _make_sampler(rate: float) -> Callable[[], bool]:
+    """Return a per-trace sampling decision specialized for ``rate``.
+
+    The common 1.0 and 0.0 rates skip the RNG call entirely.
+    """
+    if rate >= 1.0:
+        return _always_sample
+    if rate <= 0.0:
+        return _never_sample
+    rand = random.random
+
+    def _sample() -> bool:
+        return rand() < rate
+
+    return _sample
+
+
 @dataclass
 class TraceContext:
     """Context for a trace span. Used as a context manager.
@@ -425,6 +462,7 @@ class Tracer:
             meant to be passed dynamically, not stored in repo config.
         guards: Optional list of guards to auto-check on each event.
         metadata: Dict of metadata attached to every event (e.g. env, git SHA).
+            Copied once at construction; later changes to the dict are not seen.
         sampling_rate: Float 0.0-1.0. Fraction of traces to emit. 1.0 = all, 0.0 = none.
     """
 
@@ -446,8 +484,11 @@ class Tracer:
         self._service = truncate_name(service)
         self._session_id = normalize_session_id(session_id)
         self._guards = guards or []
-        self._metadata = metadata or {}
+        # Snapshot once: every event and the watermark share this JSON-safe
+        # dict, so sinks never re-coerce it or see later caller mutations.
+        self._metadata = _coerce_json_value(metadata) if metadata else {}
         self._sampling_rate = sampling_rate
+        self._should_sample = _make_sampler(sampling_rate)
         self._watermark = watermark
         self._watermark_emitted = False
 
@@ -474,7 +515,7 @@ class Tracer:
         Yields:
             A TraceContext for creating child spans and events.
         """
-        sampled = random.random() < self._sampling_rate
+        sampled = self._should_sample()
         ctx = TraceContext(
             tracer=self,
             trace_id=_new_id(),
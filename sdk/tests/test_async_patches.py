@@ -185,4 +185,4 @@ class TestPatchAnthropicAsync(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
@@ -437,4 +437,4 @@ class TestAsyncExports(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
@@ -211,4 +211,4 @@ class TestLoopGuardThreadSafety(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
@@ -137,4 +137,4 @@ class TestEstimateCostEdgeCases(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
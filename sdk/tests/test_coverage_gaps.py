@@ -715,4 +715,4 @@ class TestHttpSinkEdgeCases(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
@@ -160,4 +160,4 @@ class TestCrewHandler(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
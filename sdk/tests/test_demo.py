@@ -71,4 +71,4 @@ class TestOfflineDemo(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
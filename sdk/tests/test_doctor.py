@@ -182,4 +182,4 @@ class TestDoctor(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
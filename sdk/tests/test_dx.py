@@ -268,11 +268,21 @@ class TestTracerContextManager(unittest.TestCase):
 
 
 class TestSummarizeTrace(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One directory for the whole class; cleanup removes every trace file.
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._tmp.cleanup)
+
+    def _trace_path(self):
+        return os.path.join(self._tmp.name, f"{self._testMethodName}.jsonl")
+
     def _make_trace_file(self, events):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            for event in events:
-                f.write(json.dumps(event) + "\n")
-            return f.name
+        payload = "".join(json.dumps(event) + "\n" for event in events)
+        path = self._trace_path()
+        with open(path, "wb") as f:
+            f.write(payload.encode("utf-8"))
+        return path
 
     def test_summarize_from_file(self):
         events = [
@@ -281,14 +291,11 @@ class TestSummarizeTrace(unittest.TestCase):
             {"kind": "span", "phase": "end", "name": "agent.run", "ts": 1.5, "duration_ms": 500},
         ]
         path = self._make_trace_file(events)
-        try:
-            result = summarize_trace(path)
-            self.assertEqual(result["total_events"], 3)
-            self.assertEqual(result["spans"], 2)
-            self.assertEqual(result["events"], 1)
-            self.assertAlmostEqual(result["duration_ms"], 500.0)
-        finally:
-            os.unlink(path)
+        result = summarize_trace(path)
+        self.assertEqual(result["total_events"], 3)
+        self.assertEqual(result["spans"], 2)
+        self.assertEqual(result["events"], 1)
+        self.assertAlmostEqual(result["duration_ms"], 500.0)
 
     def test_summarize_from_list(self):
         events = [
@@ -342,19 +349,15 @@ class TestSummarizeTrace(unittest.TestCase):
             summarize_trace(42)
 
     def test_summarize_real_trace(self):
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            path = f.name
-        try:
-            sink = JsonlFileSink(path)
-            tracer = Tracer(sink=sink, service="test")
-            with tracer.trace("agent.run") as ctx:
-                ctx.event("tool.search", data={"q": "test"})
-                with ctx.span("tool.lookup"):
-                    ctx.event("tool.result", data={"found": True})
-            result = summarize_trace(path)
-            self.assertGreater(result["total_events"], 0)
-        finally:
-            os.unlink(path)
+        path = self._trace_path()
+        sink = JsonlFileSink(path)
+        tracer = Tracer(sink=sink, service="test")
+        with tracer.trace("agent.run") as ctx:
+            ctx.event("tool.search", data={"q": "test"})
+            with ctx.span("tool.lookup"):
+                ctx.event("tool.result", data={"found": True})
+        result = summarize_trace(path)
+        self.assertGreater(result["total_events"], 0)
 
 
 # ---------------------------------------------------------------------------
@@ -424,4 +427,4 @@ class TestWatermark(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
@@ -290,4 +290,4 @@ class TestEvalResult(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
@@ -103,6 +103,34 @@ class TestExportJson(unittest.TestCase):
             os.unlink(input_f.name)
             os.unlink(output_f.name)
 
+    def test_export_json_matches_indented_dump(self):
+        events = [
+            {"name": "a", "data": {"nested": [1, 2]}},
+            {"name": "b", "kind": "event"},
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = os.path.join(tmpdir, "trace.jsonl")
+            output_path = os.path.join(tmpdir, "trace.json")
+            with open(input_path, "w") as f:
+                for e in events:
+                    f.write(json.dumps(e) + "\n")
+                f.write("not json\n")
+
+            count = export_json(input_path, output_path)
+            self.assertEqual(count, 2)
+            with open(output_path) as f:
+                self.assertEqual(f.read(), json.dumps(events, indent=2, sort_keys=True))
+
+    def test_export_json_in_place(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "trace.jsonl")
+            with open(path, "w") as f:
+                f.write('{"kind": "span", "name": "a"}\n{"kind": "event", "name": "b"}\n')
+
+            self.assertEqual(export_json(path, path), 2)
+            with open(path) as f:
+                self.assertEqual(len(json.load(f)), 2)
+
 
 class TestExportCsv(unittest.TestCase):
     def test_export_csv(self):
@@ -187,6 +215,19 @@ class TestExportCsv(unittest.TestCase):
             os.unlink(output_f.name)
 
 
+    def test_export_csv_in_place(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "trace.jsonl")
+            with open(path, "w") as f:
+                f.write(json.dumps({"service": "test", "name": "a"}) + "\n")
+                f.write(json.dumps({"service": "test", "name": "b"}) + "\n")
+
+            self.assertEqual(export_csv(path, path), 2)
+            with open(path, newline="") as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual([row["name"] for row in rows], ["a", "b"])
+
+
 class TestExportJsonl(unittest.TestCase):
     def test_export_jsonl_normalizes(self):
         input_f = tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False)
@@ -211,6 +252,17 @@ class TestExportJsonl(unittest.TestCase):
             os.unlink(input_f.name)
             os.unlink(output_f.name)
 
+    def test_export_jsonl_in_place(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "trace.jsonl")
+            with open(path, "w") as f:
+                f.write('{"kind":"span","name":"a"}\nnot json\n{"kind":"event","name":"b"}\n')
+
+            self.assertEqual(export_jsonl(path, path), 2)
+            with open(path) as f:
+                lines = [json.loads(line) for line in f]
+            self.assertEqual([e["name"] for e in lines], ["a", "b"])
+
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
@@ -149,4 +149,4 @@ class TestTopLevelExports(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
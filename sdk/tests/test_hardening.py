@@ -272,58 +272,72 @@ class TestInitValidation:
 # --- IDN/SSRF protection (from v1.1.0) ---
 
 
-class TestIdnSsrfProtection:
-    def test_ascii_hostname_allowed(self):
-        _validate_url("https://example.com/api/ingest")
+_ACCEPTED_URLS = [
+    ("https://example.com/api/ingest", {}),
+    ("https://93.184.216.34/api/ingest", {}),
+    ("https://127.0.0.1/api/ingest", {"allow_private": True}),
+    ("https://xn--nxasmq6b.example.com/api", {"allow_private": True}),
+]
 
-    def test_ip_address_allowed(self):
-        _validate_url("https://93.184.216.34/api/ingest")
+_REJECTED_URLS = [
+    ("https://127.0.0.1/api/ingest", "private"),
+    ("https://\u2139ocalhost/api/ingest", "non-ASCII"),
+    ("ftp://example.com/api", None),
+    ("https:///api", None),
+]
 
-    def test_private_ip_blocked(self):
-        with pytest.raises(ValueError, match="private"):
-            _validate_url("https://127.0.0.1/api/ingest")
 
-    def test_allow_private_flag(self):
-        _validate_url("https://127.0.0.1/api/ingest", allow_private=True)
+class TestIdnSsrfProtection:
+    @pytest.mark.parametrize(("url", "kwargs"), _ACCEPTED_URLS)
+    def test_url_accepted(self, url, kwargs):
+        _validate_url(url, **kwargs)
+
+    @pytest.mark.parametrize(("url", "match"), _REJECTED_URLS)
+    def test_url_rejected(self, url, match):
+        with pytest.raises(ValueError, match=match):
+            _validate_url(url)
 
-    def test_non_ascii_hostname_rejected(self):
-        with pytest.raises(ValueError, match="non-ASCII"):
-            _validate_url("https://\u2139ocalhost/api/ingest")
 
-    def test_punycode_direct_allowed(self):
-        _validate_url("https://xn--nxasmq6b.example.com/api", allow_private=True)
+# --- Name length limits (from v1.1.0) ---
 
-    def test_invalid_scheme_rejected(self):
-        with pytest.raises(ValueError):
-            _validate_url("ftp://example.com/api")
+# Built once at import; the tests only read them.
+_AT_LIMIT_NAME = "x" * _MAX_NAME_LENGTH
+_LONG_NAME = "x" * (_MAX_NAME_LENGTH + 500)
+_LONG_WARN_NAME = "y" * (_MAX_NAME_LENGTH + 100)
+_LONG_SPAN_NAME = "span." + "a" * _MAX_NAME_LENGTH
+_LONG_EVENT_NAME = "event." + "b" * _MAX_NAME_LENGTH
+_LONG_CHILD_NAME = "child." + "c" * _MAX_NAME_LENGTH
 
-    def test_missing_hostname_rejected(self):
-        with pytest.raises(ValueError):
-            _validate_url("https:///api")
 
+class _CollectorSink:
+    def __init__(self) -> None:
+        self.events: List[dict] = []
 
-# --- Name length limits (from v1.1.0) ---
+    def emit(self, event):
+        self.events.append(event)
 
 
 class TestNameLengthLimits:
+    @staticmethod
+    def _tracer():
+        sink = _CollectorSink()
+        return Tracer(sink=sink), sink.events
+
     def test_short_name_passes_through(self):
         result = _truncate_name("tool.search")
         assert result == "tool.search"
 
     def test_exact_limit_passes_through(self):
-        name = "x" * _MAX_NAME_LENGTH
-        result = _truncate_name(name)
-        assert result == name
+        result = _truncate_name(_AT_LIMIT_NAME)
+        assert result == _AT_LIMIT_NAME
 
     def test_long_name_truncated(self):
-        name = "x" * (_MAX_NAME_LENGTH + 500)
-        result = _truncate_name(name)
+        result = _truncate_name(_LONG_NAME)
         assert len(result) == _MAX_NAME_LENGTH
 
     def test_truncation_logs_warning(self, caplog):
-        name = "y" * (_MAX_NAME_LENGTH + 100)
         with caplog.at_level(logging.WARNING, logger="agentguard.tracing"):
-            _truncate_name(name)
+            _truncate_name(_LONG_WARN_NAME)
         assert any("truncated" in r.message.lower() for r in caplog.records)
 
     def test_tracer_truncates_service_name(self):
@@ -331,31 +345,14 @@ class TestNameLengthLimits:
         tracer = Tracer(service=long_service)
         assert len(tracer._service) == _MAX_NAME_LENGTH
 
-    def test_span_name_truncated(self):
-        collected = []
-
-        class CollectorSink:
-            def emit(self, event):
-                collected.append(event)
-
-        tracer = Tracer(sink=CollectorSink())
-        long_name = "span." + "a" * _MAX_NAME_LENGTH
-        with tracer.trace(long_name):
-            pass
-        for event in collected:
-            assert len(event["name"]) <= _MAX_NAME_LENGTH
-
-    def test_event_name_truncated(self):
-        collected = []
-
-        class CollectorSink:
-            def emit(self, event):
-                collected.append(event)
-
-        tracer = Tracer(sink=CollectorSink())
-        long_event_name = "event." + "b" * _MAX_NAME_LENGTH
-        with tracer.trace("test") as ctx:
-            ctx.event(long_event_name)
-        event_names = [e["name"] for e in collected if e["kind"] == "event"]
-        for name in event_names:
+    def test_all_names_truncated(self):
+        tracer, collected = self._tracer()
+        with tracer.trace(_LONG_SPAN_NAME) as ctx:
+            ctx.event(_LONG_EVENT_NAME)
+            with ctx.span(_LONG_CHILD_NAME):
+                pass
+        names = {event["name"] for event in collected}
+        for long_name in (_LONG_SPAN_NAME, _LONG_EVENT_NAME, _LONG_CHILD_NAME):
+            assert long_name[:_MAX_NAME_LENGTH] in names
+        for name in names:
             assert len(name) <= _MAX_NAME_LENGTH
@@ -1,24 +1,30 @@
+import gzip
 import json
+import os
 import threading
 import time
 import unittest
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
 from typing import ClassVar
+from unittest.mock import patch
 
-from agentguard.sinks.http import HttpSink, _normalize_event_for_ingest
+from agentguard.sinks.http import (
+    HttpSink,
+    _gzip_body,
+    _new_idempotency_key,
+    _normalize_event_for_ingest,
+)
 
 
 class _CollectorHandler(BaseHTTPRequestHandler):
     received: ClassVar[list] = []
 
     def do_POST(self):
-        import gzip as _gzip
-
         length = int(self.headers.get("Content-Length", 0))
         raw = self.rfile.read(length)
         encoding = self.headers.get("Content-Encoding", "")
         if encoding == "gzip":
-            raw = _gzip.decompress(raw)
+            raw = gzip.decompress(raw)
         body = raw.decode("utf-8")
         auth = self.headers.get("Authorization", "")
         self.__class__.received.append({"body": body, "auth": auth})
@@ -79,6 +85,82 @@ class TestHttpSink(unittest.TestCase):
         parsed = json.loads(lines[0])
         self.assertEqual(parsed["event"], "timer")
 
+    def test_max_event_age_flushes_before_interval(self):
+        sink = HttpSink(
+            url=f"http://127.0.0.1:{self.port}/ingest",
+            _allow_private=True,
+            batch_size=100,
+            flush_interval=60,
+            max_event_age=0.05,
+        )
+        sink.emit({"event": "lingering"})
+        deadline = time.monotonic() + 2
+        while not _CollectorHandler.received and time.monotonic() < deadline:
+            time.sleep(0.01)
+        received = len(_CollectorHandler.received)
+        sink.shutdown()
+        self.assertEqual(received, 1)
+
+    def test_flush_sends_partial_batch_synchronously(self):
+        sink = HttpSink(
+            url=f"http://127.0.0.1:{self.port}/ingest",
+            _allow_private=True,
+            batch_size=100,
+            flush_interval=60,
+        )
+        sink.emit({"event": "partial"})
+        sink.flush()
+        received = len(_CollectorHandler.received)
+        sink.shutdown()
+        self.assertEqual(received, 1)
+
+    def test_flush_waits_for_batch_already_in_flight(self):
+        sink = HttpSink(
+            url=f"http://127.0.0.1:{self.port}/ingest",
+            _allow_private=True,
+            batch_size=100,
+            flush_interval=60,
+        )
+        started = threading.Event()
+        release = threading.Event()
+        delivered = []
+
+        def slow_post(body, headers):
+            started.set()
+            release.wait(5)
+            delivered.append(body)
+
+        sink._post = slow_post
+        sink.emit({"event": "in-flight"})
+        # Another thread takes the batch and stalls mid-POST, leaving the
+        # buffer empty when flush() is called.
+        sender = threading.Thread(target=sink._flush)
+        sender.start()
+        self.assertTrue(started.wait(5))
+        threading.Timer(0.05, release.set).start()
+        self.assertTrue(sink.flush())
+        self.assertEqual(len(delivered), 1)
+        sender.join()
+        sink.shutdown()
+
+    def test_flush_timeout_bounds_wait_on_stalled_post(self):
+        sink = HttpSink(
+            url=f"http://127.0.0.1:{self.port}/ingest",
+            _allow_private=True,
+            batch_size=100,
+            flush_interval=60,
+        )
+        release = threading.Event()
+        sink._post = lambda body, headers: release.wait(5)
+        sink.emit({"event": "stalled"})
+        try:
+            with self.assertLogs("agentguard.sinks.http", level="WARNING"):
+                self.assertFalse(sink.flush(timeout=0.05))
+        finally:
+            release.set()
+        self.assertTrue(sink.flush())
+        sink.shutdown()
+
     def test_shutdown_flushes_remaining(self):
         sink = HttpSink(
             url=f"http://127.0.0.1:{self.port}/ingest",
@@ -109,6 +191,32 @@ class TestHttpSink(unittest.TestCase):
         normalized = _normalize_event_for_ingest({"event": "timer"})
         self.assertEqual(normalized, {"event": "timer"})
 
+    def test_gzip_body_is_standalone_gzip_member(self):
+        first = _gzip_body(b'{"event": 1}')
+        second = _gzip_body(b'{"event": 2}')
+        self.assertEqual(first[:2], b"\x1f\x8b")
+        self.assertEqual(gzip.decompress(first), b'{"event": 1}')
+        self.assertEqual(gzip.decompress(second), b'{"event": 2}')
+
+    def test_idempotency_key_is_url_safe_128_bit(self):
+        keys = {_new_idempotency_key() for _ in range(100)}
+        self.assertEqual(len(keys), 100)
+        for key in keys:
+            self.assertEqual(len(key), 22)
+            self.assertRegex(key, r"^[A-Za-z0-9_-]+$")
+
+    def test_compress_level_out_of_range_rejected(self):
+        with self.assertRaises(ValueError):
+            HttpSink(
+                url="http://127.0.0.1:1/ingest", _allow_private=True, compress_level=10,
+            )
+
+    def test_max_event_age_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            HttpSink(
+                url="http://127.0.0.1:1/ingest", _allow_private=True, max_event_age=0,
+            )
+
 
 class TestHttpSinkHTTPWarning(unittest.TestCase):
     def test_warns_on_http_with_api_key(self):
@@ -200,6 +308,159 @@ class TestHttpSinkRetryAfterHttpDate(unittest.TestCase):
         self.assertGreaterEqual(_429DateHandler.call_count, 2)
 
 
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 handler that records the client port of each request."""
+
+    protocol_version = "HTTP/1.1"
+    client_ports: ClassVar[list] = []
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self.__class__.client_ports.append(self.client_address[1])
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpSinkKeepAlive(unittest.TestCase):
+    def test_batches_reuse_one_connection(self):
+        _KeepAliveHandler.client_ports = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            sink = HttpSink(
+                url=f"http://127.0.0.1:{server.server_address[1]}/ingest",
+                _allow_private=True,
+                batch_size=1,
+                flush_interval=60,
+            )
+            for i in range(3):
+                sink.emit({"event": i})
+            sink.shutdown()
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(len(_KeepAliveHandler.client_ports), 3)
+        self.assertEqual(len(set(_KeepAliveHandler.client_ports)), 1)
+
+    def test_reconnects_after_server_drops_idle_connection(self):
+        _IdleDropHandler.client_ports = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _IdleDropHandler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            sink = HttpSink(
+                url=f"http://127.0.0.1:{server.server_address[1]}/ingest",
+                _allow_private=True,
+                batch_size=1,
+                flush_interval=60,
+                max_retries=1,
+            )
+            with patch("agentguard.sinks.http.logger.warning") as warning:
+                sink.emit({"event": 1})
+                sink.emit({"event": 2})
+            sink.shutdown()
+            warning.assert_not_called()
+        finally:
+            server.shutdown()
+            server.server_close()
+        # The second batch hit the stale socket and was resent on a new one
+        self.assertEqual(len(_IdleDropHandler.client_ports), 2)
+        self.assertEqual(len(set(_IdleDropHandler.client_ports)), 2)
+
+    def test_ipv6_literal_without_port_uses_scheme_default(self):
+        sink = HttpSink(url="https://[2606:4700:4700::1111]/ingest", flush_interval=60)
+        try:
+            conn = sink._conn_cls(sink._host, sink._port)
+            self.assertEqual(conn.host, "2606:4700:4700::1111")
+            self.assertEqual(conn.port, 443)
+        finally:
+            sink.shutdown()
+
+    def test_proxied_endpoint_uses_urllib_opener(self):
+        env = {"https_proxy": "http://proxy.example.com:3128", "no_proxy": ""}
+        with patch.dict(os.environ, env):
+            sink = HttpSink(url="https://example.com/ingest", flush_interval=60)
+        sink.shutdown()
+        self.assertTrue(sink._use_opener)
+
+
+class _IdleDropHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 handler that closes the socket after each reply without
+    sending ``Connection: close``, like a server reaping an idle keep-alive."""
+
+    protocol_version = "HTTP/1.1"
+    client_ports: ClassVar[list] = []
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self.__class__.client_ports.append(self.client_address[1])
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+        self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+class _RedirectHandler(BaseHTTPRequestHandler):
+    """Answers every POST with a redirect to the cloud metadata address."""
+
+    posts = 0
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self.__class__.posts += 1
+        self.send_response(302)
+        self.send_header("Location", "http://169.254.169.254/latest/meta-data/")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpSinkRedirect(unittest.TestCase):
+    def test_redirect_to_metadata_ip_is_blocked_after_one_post(self):
+        _RedirectHandler.posts = 0
+        server = HTTPServer(("127.0.0.1", 0), _RedirectHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            sink = HttpSink(
+                url=f"http://127.0.0.1:{server.server_address[1]}/ingest",
+                _allow_private=True,
+                batch_size=100,
+                flush_interval=60,
+                max_retries=1,
+            )
+            sink.emit({"event": "redirected"})
+            with self.assertLogs("agentguard.sinks.http", level="WARNING") as cm:
+                sink.flush()
+            sink.shutdown()
+        finally:
+            server.shutdown()
+            server.server_close()
+        # The redirect target is rejected before any request is made to it,
+        # and the batch was POSTed to the origin only once.
+        self.assertEqual(_RedirectHandler.posts, 1)
+        error = cm.records[-1].exc_info[1]
+        self.assertIsInstance(error, ValueError)
+        self.assertIn("169.254.169.254", str(error))
+
+
 class TestHttpSinkExports(unittest.TestCase):
     def test_importable_from_top_level(self):
         """HttpSink should be importable from agentguard directly."""
@@ -274,4 +535,4 @@ class TestHttpSinkSSRF(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
@@ -16,6 +16,8 @@ import pytest
 import agentguard
 from agentguard.setup import shutdown
 
+_VERSION_RE = re.compile(r'^version\s*=\s*"([^"]+)"', re.MULTILINE)
+
 
 class CollectorSink:
     def __init__(self) -> None:
@@ -498,7 +500,7 @@ class TestModuleLevelAccess:
     def test_module_version_matches_repo_pyproject(self):
         pyproject_path = Path(__file__).resolve().parents[1] / "pyproject.toml"
         content = pyproject_path.read_text(encoding="utf-8")
-        match = re.search(r'^version\s*=\s*"([^"]+)"', content, re.MULTILINE)
+        match = _VERSION_RE.search(content)
 
         assert match is not None
         assert agentguard.__version__ == match.group(1)
@@ -207,4 +207,4 @@ class TestEmitLlmResult(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
@@ -199,4 +199,4 @@ class TestUnpatchSafeWhenNotPatched(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
@@ -370,4 +370,4 @@ class _MockAnthropicResponse:
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
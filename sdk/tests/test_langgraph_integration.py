@@ -164,4 +164,4 @@ class TestSummarizeState(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
@@ -1,3 +1,4 @@
+import functools
 import json
 from pathlib import Path
 
@@ -14,6 +15,12 @@ MCP_SMITHERY = REPO_ROOT / "mcp-server" / "smithery.yaml"
 
 
 def _load_json(path: Path):
+    return _parse_json(path, path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_json(path: Path, mtime_ns: int):
+    # mtime_ns is part of the cache key so an edited file is re-read.
     with path.open("r", encoding="utf-8") as handle:
         return json.load(handle)
 
@@ -6,7 +6,7 @@ interfaces to verify our mapping logic without requiring the actual SDK.
 from __future__ import annotations
 
 import unittest
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from unittest.mock import MagicMock, patch, call
 import sys
 import types
@@ -29,6 +29,16 @@ _mock_otel.context = _mock_context
 class FakeSpan:
     """Mock OTel Span that records calls."""
 
+    __slots__ = (
+        "attributes",
+        "ended",
+        "events",
+        "name",
+        "parent_context",
+        "status_code",
+        "status_message",
+    )
+
     def __init__(self, name: str):
         self.name = name
         self.attributes: Dict[str, Any] = {}
@@ -55,6 +65,8 @@ class FakeSpan:
 class FakeTracer:
     """Mock OTel Tracer."""
 
+    __slots__ = ("spans",)
+
     def __init__(self):
         self.spans: List[FakeSpan] = []
 
@@ -64,10 +76,20 @@ class FakeTracer:
         self.spans.append(span)
         return span
 
+    def start_spans(self, specs: List[Tuple[str, Any, Any]]) -> List[FakeSpan]:
+        """Start many spans at once from ``(name, kind, context)`` specs."""
+        new = [FakeSpan(name) for name, _kind, _context in specs]
+        for span, (_name, _kind, context) in zip(new, specs):
+            span.parent_context = context
+        self.spans.extend(new)
+        return new
+
 
 class FakeTracerProvider:
     """Mock OTel TracerProvider."""
 
+    __slots__ = ("_tracer",)
+
     def __init__(self):
         self._tracer = FakeTracer()
 
@@ -131,28 +153,6 @@ class TestOtelTraceSink(unittest.TestCase):
         self.assertTrue(span.ended)
         self.assertEqual(span.attributes["agentguard.duration_ms"], 1000.0)
 
-    def test_span_with_error(self):
-        """Span end with error sets ERROR status."""
-        sink = self.OtelTraceSink(self.provider)
-
-        sink.emit({
-            "kind": "span", "phase": "start",
-            "trace_id": "t1", "span_id": "s1", "name": "failing",
-            "ts": 100.0, "service": "test",
-        })
-        sink.emit({
-            "kind": "span", "phase": "end",
-            "trace_id": "t1", "span_id": "s1", "name": "failing",
-            "ts": 101.0, "duration_ms": 1000.0,
-            "error": {"type": "ValueError", "message": "bad input"},
-        })
-
-        span = self.provider._tracer.spans[0]
-        self.assertTrue(span.ended)
-        # StatusCode.ERROR = 2
-        self.assertEqual(span.status_code, 2)
-        self.assertEqual(span.attributes["agentguard.error.type"], "ValueError")
-
     def test_point_event(self):
         """Point events are added to the parent span."""
         sink = self.OtelTraceSink(self.provider)
@@ -285,28 +285,46 @@ class TestOtelTraceSink(unittest.TestCase):
         # Parent should have no parent context
         self.assertIsNone(parent_span.parent_context)
 
-    def test_string_error_handling(self):
-        """Error field as string (not dict) doesn't crash."""
-        sink = self.OtelTraceSink(self.provider)
+    def test_fake_tracer_start_spans_batch(self):
+        """Batch span creation preserves order and parent contexts."""
+        tracer = FakeTracer()
+        ctx = {"parent_span": "p"}
+        spans = tracer.start_spans([("a", None, None), ("b", None, ctx)])
 
-        sink.emit({
-            "kind": "span", "phase": "start",
-            "trace_id": "t1", "span_id": "s1", "name": "op",
-            "ts": 100.0, "service": "test",
-        })
-        sink.emit({
-            "kind": "span", "phase": "end",
-            "trace_id": "t1", "span_id": "s1", "name": "op",
-            "ts": 101.0, "duration_ms": 1000.0,
-            "error": "something broke",
-        })
+        self.assertEqual([s.name for s in spans], ["a", "b"])
+        self.assertEqual(tracer.spans, spans)
+        self.assertIsNone(spans[0].parent_context)
+        self.assertIs(spans[1].parent_context, ctx)
 
-        span = self.provider._tracer.spans[0]
-        self.assertTrue(span.ended)
-        self.assertEqual(span.status_code, 2)  # ERROR
-        self.assertEqual(span.attributes["agentguard.error.message"], "something broke")
-        self.assertEqual(span.attributes["agentguard.error.type"], "str")
+    def test_error_status_variants(self):
+        """Dict and string error payloads both set ERROR status on span end."""
+        sink = self.OtelTraceSink(self.provider)
+        cases = [
+            ({"type": "ValueError", "message": "bad input"}, "ValueError", "bad input"),
+            ("something broke", "str", "something broke"),
+        ]
+
+        for i, (error, err_type, message) in enumerate(cases):
+            with self.subTest(error=error):
+                span_id = f"s{i}"
+                sink.emit({
+                    "kind": "span", "phase": "start",
+                    "trace_id": "t1", "span_id": span_id, "name": "failing",
+                    "ts": 100.0, "service": "test",
+                })
+                sink.emit({
+                    "kind": "span", "phase": "end",
+                    "trace_id": "t1", "span_id": span_id, "name": "failing",
+                    "ts": 101.0, "duration_ms": 1000.0,
+                    "error": error,
+                })
+
+                span = self.provider._tracer.spans[i]
+                self.assertTrue(span.ended)
+                self.assertEqual(span.status_code, 2)  # ERROR
+                self.assertEqual(span.attributes["agentguard.error.type"], err_type)
+                self.assertEqual(span.attributes["agentguard.error.message"], message)
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
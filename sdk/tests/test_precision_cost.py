@@ -490,4 +490,4 @@ class TestNoDoubleConsumePatchPath(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
@@ -4,9 +4,9 @@ import json
 import os
 import tempfile
 import threading
-import time
 import unittest
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import ClassVar
+from unittest.mock import patch
 from urllib.error import HTTPError
 
 from agentguard import Tracer, JsonlFileSink
@@ -38,6 +38,20 @@ class TestTracerMetadata(unittest.TestCase):
             self.assertEqual(e.get("metadata", {}).get("env"), "staging")
             self.assertEqual(e.get("metadata", {}).get("git_sha"), "abc123")
 
+    def test_metadata_snapshotted_once(self):
+        metadata = {"env": "staging", "tags": ("a", "b"), "obj": object()}
+        tracer = Tracer(sink=JsonlFileSink(self.path), service="test", metadata=metadata)
+        metadata["env"] = "prod"
+        with tracer.trace("agent.run"):
+            pass
+
+        with open(self.path) as f:
+            events = [json.loads(line) for line in f if line.strip()]
+        for e in events:
+            self.assertEqual(e["metadata"]["env"], "staging")
+            self.assertEqual(e["metadata"]["tags"], ["a", "b"])
+            self.assertTrue(e["metadata"]["obj"]["_non_serializable"])
+
     def test_no_metadata_when_empty(self):
         tracer = Tracer(sink=JsonlFileSink(self.path), service="test")
         with tracer.trace("agent.run") as span:
@@ -92,6 +106,12 @@ class TestTracerSamplingRate(unittest.TestCase):
         self.assertGreater(len(captured), 0)
         self.assertLess(len(captured), 200)
 
+    def test_sampling_extremes_skip_rng(self):
+        """Rates of 0.0 and 1.0 decide without calling random.random()."""
+        with patch("agentguard.tracing.random.random", side_effect=AssertionError):
+            self.assertTrue(Tracer(sampling_rate=1.0)._should_sample())
+            self.assertFalse(Tracer(sampling_rate=0.0)._should_sample())
+
     def test_sampling_concurrent_traces_isolated(self):
         """Concurrent traces should not interfere with each other's sampling."""
         captured = []
@@ -103,8 +123,6 @@ class TestTracerSamplingRate(unittest.TestCase):
         # One tracer, rate=1.0 — all traces must emit all events
         tracer = Tracer(sink=CaptureSink(), service="test", sampling_rate=1.0)
 
-        import threading
-
         def run_trace(name):
             with tracer.trace(name) as span:
                 span.event(f"{name}.step")
@@ -149,98 +167,91 @@ class TestTracerSamplingRate(unittest.TestCase):
         self.assertEqual(len(trace_events), 6)
 
 
-class _GzipCollectorHandler(BaseHTTPRequestHandler):
-    received: list = []
+class _MockResponse:
+    status = 200
+    reason = "OK"
+
+    def __init__(self):
+        self.headers = {}
+
+    def read(self):
+        return b"ok"
+
+
+class _MockConnection:
+    """Stands in for HttpSink's http.client connection and records requests."""
+
+    received: ClassVar[list] = []
+
+    def __init__(self, host, port=None, timeout=None):
+        pass
 
-    def do_POST(self):
-        length = int(self.headers.get("Content-Length", 0))
-        body = self.rfile.read(length)
-        encoding = self.headers.get("Content-Encoding", "")
-        idempotency_key = self.headers.get("Idempotency-Key", "")
+    def request(self, method, path, body=None, headers=None):
+        headers = headers or {}
+        encoding = headers.get("Content-Encoding", "")
         if encoding == "gzip":
             body = gzip.decompress(body)
         self.__class__.received.append({
             "body": body.decode("utf-8"),
             "encoding": encoding,
-            "idempotency_key": idempotency_key,
+            "idempotency_key": headers.get("Idempotency-Key", ""),
         })
-        self.send_response(200)
-        self.end_headers()
-        self.wfile.write(b"ok")
 
-    def log_message(self, *args):
+    def getresponse(self):
+        return _MockResponse()
+
+    def close(self):
         pass
 
 
 class TestHttpSinkGzip(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        _GzipCollectorHandler.received = []
-        cls.server = HTTPServer(("127.0.0.1", 0), _GzipCollectorHandler)
-        cls.port = cls.server.server_address[1]
-        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
-        cls.server_thread.start()
-
-    @classmethod
-    def tearDownClass(cls):
-        cls.server.shutdown()
-
     def setUp(self):
-        _GzipCollectorHandler.received.clear()
+        _MockConnection.received = []
 
-    def test_gzip_compressed(self):
+    def _make_sink(self, **kwargs):
         sink = HttpSink(
-            url=f"http://127.0.0.1:{self.port}/ingest", _allow_private=True,
-            batch_size=2,
+            url="http://127.0.0.1:1/ingest", _allow_private=True,
             flush_interval=60,
-            compress=True,
+            **kwargs,
         )
+        sink._conn_cls = _MockConnection
+        return sink
+
+    def test_gzip_compressed(self):
+        sink = self._make_sink(batch_size=2, compress=True)
         sink.emit({"event": 1})
         sink.emit({"event": 2})
-        time.sleep(0.3)
+        sink.flush()
         sink.shutdown()
-        self.assertGreaterEqual(len(_GzipCollectorHandler.received), 1)
-        self.assertEqual(_GzipCollectorHandler.received[0]["encoding"], "gzip")
+        self.assertGreaterEqual(len(_MockConnection.received), 1)
+        self.assertEqual(_MockConnection.received[0]["encoding"], "gzip")
 
     def test_no_compression(self):
-        sink = HttpSink(
-            url=f"http://127.0.0.1:{self.port}/ingest", _allow_private=True,
-            batch_size=2,
-            flush_interval=60,
-            compress=False,
-        )
+        sink = self._make_sink(batch_size=2, compress=False)
         sink.emit({"event": 1})
         sink.emit({"event": 2})
-        time.sleep(0.3)
+        sink.flush()
         sink.shutdown()
-        self.assertGreaterEqual(len(_GzipCollectorHandler.received), 1)
-        self.assertEqual(_GzipCollectorHandler.received[0]["encoding"], "")
+        self.assertGreaterEqual(len(_MockConnection.received), 1)
+        self.assertEqual(_MockConnection.received[0]["encoding"], "")
 
     def test_idempotency_key_present(self):
-        sink = HttpSink(
-            url=f"http://127.0.0.1:{self.port}/ingest", _allow_private=True,
-            batch_size=1,
-            flush_interval=60,
-        )
+        sink = self._make_sink(batch_size=1)
         sink.emit({"event": 1})
-        time.sleep(0.3)
+        sink.flush()
         sink.shutdown()
-        self.assertGreaterEqual(len(_GzipCollectorHandler.received), 1)
-        key = _GzipCollectorHandler.received[0]["idempotency_key"]
+        self.assertGreaterEqual(len(_MockConnection.received), 1)
+        key = _MockConnection.received[0]["idempotency_key"]
         self.assertTrue(len(key) > 0)
 
     def test_unique_idempotency_keys(self):
-        sink = HttpSink(
-            url=f"http://127.0.0.1:{self.port}/ingest", _allow_private=True,
-            batch_size=1,
-            flush_interval=60,
-        )
+        sink = self._make_sink(batch_size=1)
         sink.emit({"event": 1})
-        time.sleep(0.2)
         sink.emit({"event": 2})
-        time.sleep(0.2)
+        sink.flush()
         sink.shutdown()
-        keys = [r["idempotency_key"] for r in _GzipCollectorHandler.received]
+        keys = [r["idempotency_key"] for r in _MockConnection.received]
+        self.assertEqual(len(keys), 2)
         self.assertEqual(len(keys), len(set(keys)))  # all unique
 
 
@@ -319,4 +330,4 @@ class TestCliEvalCi(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
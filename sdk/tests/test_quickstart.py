@@ -245,4 +245,4 @@ class TestQuickstart(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
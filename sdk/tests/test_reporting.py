@@ -183,4 +183,4 @@ class TestIncidentRendering(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
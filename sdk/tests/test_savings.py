@@ -442,4 +442,4 @@ class TestSummarizeSavings(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
@@ -146,4 +146,4 @@ class TestSkillpack(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
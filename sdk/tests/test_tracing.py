@@ -15,12 +15,12 @@ def test_trace_emits_events():
         tracer = Tracer(sink=JsonlFileSink(path))
         with tracer.trace("agent.run", data={"user": "u1"}) as span:
             span.event("reasoning.step", data={"step": 1})
-        with open(path, encoding="utf-8") as f:
-            lines = [line for line in f.read().splitlines() if line]
+        with open(path, "rb") as f:
+            raw = f.read()
     finally:
         os.unlink(path)
 
-    events = [json.loads(line) for line in lines]
+    events = [json.loads(line) for line in raw.split(b"\n") if line]
     assert len(events) >= 2
     names = [e["name"] for e in events]
     assert "agent.run" in names
@@ -215,4 +215,4 @@ class TestTracerGuardDispatch(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)
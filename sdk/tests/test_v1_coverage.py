@@ -3,14 +3,25 @@ import io
 import json
 import os
 import tempfile
+import threading
 import unittest
+from contextlib import redirect_stdout
 from unittest.mock import patch
 
+from agentguard import AsyncTracer
 from agentguard.tracing import StdoutSink, JsonlFileSink, Tracer
 from agentguard.sinks.http import HttpSink
 from agentguard.cli import _summarize, _report, _eval
 
 
+class _CaptureSink:
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event):
+        self.events.append(event)
+
+
 class TestStdoutSink(unittest.TestCase):
     def test_emit_prints_json(self):
         sink = StdoutSink()
@@ -28,16 +39,17 @@ class TestStdoutSink(unittest.TestCase):
 class TestJsonlFileSinkEdgeCases(unittest.TestCase):
     def test_concurrent_writes(self):
         """Multiple threads writing to the same sink should not corrupt data."""
-        import threading
         fd, path = tempfile.mkstemp(suffix=".jsonl")
         os.close(fd)
         sink = JsonlFileSink(path)
+        barrier = threading.Barrier(2)
 
         def write_events(n):
-            for i in range(50):
+            barrier.wait()
+            for i in range(10):
                 sink.emit({"thread": n, "i": i})
 
-        threads = [threading.Thread(target=write_events, args=(t,)) for t in range(4)]
+        threads = [threading.Thread(target=write_events, args=(t,)) for t in range(2)]
         for t in threads:
             t.start()
         for t in threads:
@@ -45,7 +57,7 @@ class TestJsonlFileSinkEdgeCases(unittest.TestCase):
 
         with open(path) as f:
             lines = [line.strip() for line in f if line.strip()]
-        self.assertEqual(len(lines), 200)  # 4 threads * 50 events
+        self.assertEqual(len(lines), 20)  # 2 threads * 10 events
         # Verify all lines are valid JSON
         for line in lines:
             json.loads(line)
@@ -53,9 +65,13 @@ class TestJsonlFileSinkEdgeCases(unittest.TestCase):
 
 
 class TestCliSubcommands(unittest.TestCase):
-    def setUp(self):
-        fd, self.path = tempfile.mkstemp(suffix=".jsonl")
-        with os.fdopen(fd, "w") as f:
+    @classmethod
+    def setUpClass(cls):
+        # The subcommands only read the trace, so every test shares one file.
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls.path = os.path.join(tmp.name, "trace.jsonl")
+        with open(cls.path, "w") as f:
             f.write(json.dumps({
                 "name": "agent.run", "kind": "span", "phase": "start",
                 "ts": 1000.0, "data": {},
@@ -69,36 +85,28 @@ class TestCliSubcommands(unittest.TestCase):
                 "ts": 1000.05, "duration_ms": 50, "data": {}, "error": None,
             }) + "\n")
 
-    def tearDown(self):
-        os.unlink(self.path)
+    @staticmethod
+    def _capture(command, *args, **kwargs):
+        captured = io.StringIO()
+        with redirect_stdout(captured):
+            command(*args, **kwargs)
+        return captured.getvalue()
 
     def test_summarize(self):
-        captured = io.StringIO()
-        with patch("sys.stdout", captured):
-            _summarize(self.path)
-        output = captured.getvalue()
+        output = self._capture(_summarize, self.path)
         self.assertIn("events: 3", output)
 
     def test_report(self):
-        captured = io.StringIO()
-        with patch("sys.stdout", captured):
-            _report(self.path)
-        output = captured.getvalue()
+        output = self._capture(_report, self.path)
         self.assertIn("Total events: 3", output)
         self.assertIn("Reasoning steps: 1", output)
 
     def test_eval_passes(self):
-        captured = io.StringIO()
-        with patch("sys.stdout", captured):
-            _eval(self.path)
-        output = captured.getvalue()
+        output = self._capture(_eval, self.path)
         self.assertIn("PASS", output)
 
     def test_eval_ci_passes(self):
-        captured = io.StringIO()
-        with patch("sys.stdout", captured):
-            _eval(self.path, ci=True)
-        output = captured.getvalue()
+        output = self._capture(_eval, self.path, ci=True)
         self.assertIn("PASS", output)
 
 
@@ -131,41 +139,23 @@ class TestHttpSinkUrlValidation(unittest.TestCase):
 
 class TestTracerGuardsWithBudgetGuard(unittest.TestCase):
     def test_tracer_with_budget_guard(self):
-        from agentguard import BudgetGuard
-        captured = []
-
-        class CaptureSink:
-            def emit(self, event):
-                captured.append(event)
-
-        tracer = Tracer(sink=CaptureSink(), service="test")
+        sink = _CaptureSink()
+        tracer = Tracer(sink=sink, service="test")
         with tracer.trace("agent.run") as span:
             span.event("step1")
             span.event("step2")
-        self.assertGreater(len(captured), 0)
+        self.assertGreater(len(sink.events), 0)
 
 
-class TestAsyncTracerMetadata(unittest.TestCase):
-    def test_async_tracer_does_not_crash(self):
+class TestAsyncTracerMetadata(unittest.IsolatedAsyncioTestCase):
+    async def test_async_tracer_does_not_crash(self):
         """AsyncTracer should not crash when used without metadata/sampling."""
-        import asyncio
-        from agentguard import AsyncTracer
-
-        async def run():
-            captured = []
-
-            class CaptureSink:
-                def emit(self, event):
-                    captured.append(event)
-
-            tracer = AsyncTracer(sink=CaptureSink(), service="test")
-            async with tracer.trace("agent.run") as span:
-                span.event("step")
-            return captured
-
-        result = asyncio.run(run())
-        self.assertGreater(len(result), 0)
+        sink = _CaptureSink()
+        tracer = AsyncTracer(sink=sink, service="test")
+        async with tracer.trace("agent.run") as span:
+            span.event("step")
+        self.assertGreater(len(sink.events), 0)
 
 
 if __name__ == "__main__":
-    unittest.main()
+    unittest.main(buffer=True)